@@ -1,7 +1,8 @@
+import functools
 import os
+import shutil
 import subprocess
 import sys
-import uuid
 
 from setuptools import Extension, setup
 from setuptools.command.bdist_egg import bdist_egg
@@ -68,25 +69,40 @@ class cmake_ext(build_ext):
         # HACK: Torch cmake build system has a hard time finding CuDNN, so we
         # help it by pointing it to the right files
 
-        # First try using the `nvidia.cudnn` package (dependency of torch on PyPI)
-        try:
-            import nvidia.cudnn
-
-            cudnn_root = os.path.dirname(nvidia.cudnn.__file__)
-        except ImportError:
-            # Otherwise try to find CuDNN inside PyTorch itself
-            cudnn_root = os.path.join(torch.utils.cmake_prefix_path, "..", "..")
-
-            cudnn_version = os.path.join(cudnn_root, "include", "cudnn_version.h")
-            if not os.path.exists(cudnn_version):
-                # create a minimal cudnn_version.h (with a made-up version),
-                # because it is not bundled together with the CuDNN shared
-                # library in PyTorch conda distribution, see
-                # https://github.com/pytorch/pytorch/issues/47743
-                with open(cudnn_version, "w") as fd:
-                    fd.write("#define CUDNN_MAJOR 8\n")
-                    fd.write("#define CUDNN_MINOR 5\n")
-                    fd.write("#define CUDNN_PATCHLEVEL 0\n")
+        # the resolved CuDNN location is cached in a marker file inside
+        # `build_dir`, so incremental rebuilds skip the filesystem probing; it
+        # is re-resolved whenever the torch version changes
+        cudnn_marker = os.path.join(build_dir, ".cudnn_resolved")
+        cudnn_root = None
+        if os.path.exists(cudnn_marker):
+            with open(cudnn_marker) as fd:
+                if fd.readline().strip() == torch.__version__:
+                    cudnn_root = fd.readline().strip()
+
+        if cudnn_root is None:
+            # First try using the `nvidia.cudnn` package (dependency of torch
+            # on PyPI)
+            try:
+                import nvidia.cudnn
+
+                cudnn_root = os.path.dirname(nvidia.cudnn.__file__)
+            except ImportError:
+                # Otherwise try to find CuDNN inside PyTorch itself
+                cudnn_root = os.path.join(torch.utils.cmake_prefix_path, "..", "..")
+
+                cudnn_version = os.path.join(cudnn_root, "include", "cudnn_version.h")
+                if not os.path.exists(cudnn_version):
+                    # create a minimal cudnn_version.h (with a made-up version),
+                    # because it is not bundled together with the CuDNN shared
+                    # library in PyTorch conda distribution, see
+                    # https://github.com/pytorch/pytorch/issues/47743
+                    with open(cudnn_version, "w") as fd:
+                        fd.write("#define CUDNN_MAJOR 8\n")
+                        fd.write("#define CUDNN_MINOR 5\n")
+                        fd.write("#define CUDNN_PATCHLEVEL 0\n")
+
+            with open(cudnn_marker, "w") as fd:
+                fd.write(f"{torch.__version__}\n{cudnn_root}\n")
 
         cmake_options.append(f"-DCUDNN_INCLUDE_DIR={cudnn_root}/include")
         cmake_options.append(f"-DCUDNN_LIBRARY={cudnn_root}/lib")
@@ -96,17 +112,34 @@ class cmake_ext(build_ext):
         # end of HACK
         # ==================================================================== #
 
-        subprocess.run(
-            ["cmake", source_dir, *cmake_options],
-            cwd=build_dir,
-            check=True,
-        )
+        # prefer the Ninja generator when available: it is faster than the
+        # default Makefiles/MSBuild generators, especially for no-op rebuilds
+        if shutil.which("ninja") is not None:
+            cmake_options.append("-GNinja")
+
+        remove_build_dir_on_generator_change(build_dir, cmake_options)
+
+        if not cmake_configure_is_cached(build_dir, cmake_options):
+            subprocess.run(
+                ["cmake", source_dir, *cmake_options],
+                cwd=build_dir,
+                check=True,
+            )
+
+        # `--parallel` without a value only parallelizes with some generators,
+        # so give an explicit job count, keeping CMAKE_BUILD_PARALLEL_LEVEL as
+        # an override
+        n_jobs = os.environ.get("CMAKE_BUILD_PARALLEL_LEVEL")
+        if n_jobs is None:
+            n_jobs = str(os.cpu_count() or 2)
+
         subprocess.run(
             [
                 "cmake",
                 "--build",
                 build_dir,
                 "--parallel",
+                n_jobs,
                 "--config",
                 "Release",
                 "--target",
@@ -115,21 +148,82 @@ class cmake_ext(build_ext):
             check=True,
         )
 
-        with open(os.path.join(install_dir, "_build_versions.py"), "w") as fd:
-            fd.write("# Autogenerated file, do not edit\n\n\n")
-            # Store the version of torch used to build the extension, to give a
-            # nice error message to the user when trying to load the extension
-            # with an older torch version installed
-            fd.write(
-                "# version of torch used when compiling this package\n"
-                f"BUILD_TORCH_VERSION = '{torch.__version__}'\n\n"
-            )
+        # Store the version of torch used to build the extension, to give a
+        # nice error message to the user when trying to load the extension
+        # with an older torch version installed; same for rascaline
+        build_versions = (
+            "# Autogenerated file, do not edit\n\n\n"
+            "# version of torch used when compiling this package\n"
+            f"BUILD_TORCH_VERSION = '{torch.__version__}'\n\n"
+            "# version of rascaline used when compiling this package\n"
+            f"BUILD_RASCALINE_VERSION = '{rascaline.__version__}'\n"
+        )
 
-            # same for rascaline
-            fd.write(
-                "# version of rascaline used when compiling this package\n"
-                f"BUILD_RASCALINE_VERSION = '{rascaline.__version__}'\n"
-            )
+        # only rewrite the file when its contents change, keeping the mtime
+        # stable so downstream staleness checks see a no-op rebuild as no-op
+        build_versions_path = os.path.join(install_dir, "_build_versions.py")
+        existing_versions = None
+        if os.path.exists(build_versions_path):
+            with open(build_versions_path) as fd:
+                existing_versions = fd.read()
+
+        if build_versions != existing_versions:
+            with open(build_versions_path, "w") as fd:
+                fd.write(build_versions)
+
+
+def remove_build_dir_on_generator_change(build_dir, cmake_options):
+    """
+    Remove ``build_dir`` if it was configured with a generator different from
+    the one requested in ``cmake_options``, since cmake refuses to change the
+    generator of an existing build directory.
+    """
+    generator = None
+    for option in cmake_options:
+        if option.startswith("-G"):
+            generator = option[2:]
+
+    cmake_cache = os.path.join(build_dir, "CMakeCache.txt")
+    if generator is None or not os.path.exists(cmake_cache):
+        return
+
+    with open(cmake_cache) as fd:
+        for line in fd:
+            if line.startswith("CMAKE_GENERATOR:"):
+                if line.split("=", 1)[1].strip() != generator:
+                    shutil.rmtree(build_dir)
+                    os.makedirs(build_dir)
+                return
+
+
+def cmake_configure_is_cached(build_dir, cmake_options):
+    """
+    Check whether ``build_dir`` was already configured by cmake with the same
+    ``cmake_options``, in which case the configure step can be skipped and
+    ``cmake --build`` invoked directly, re-using previous build artifacts.
+    """
+    cmake_cache = os.path.join(build_dir, "CMakeCache.txt")
+    if not os.path.exists(cmake_cache):
+        return False
+
+    cached_variables = {}
+    with open(cmake_cache) as fd:
+        for line in fd:
+            line = line.strip()
+            if line.startswith("//") or line.startswith("#") or "=" not in line:
+                continue
+            name, value = line.split("=", 1)
+            # remove the `:TYPE` suffix from the variable name
+            cached_variables[name.split(":")[0]] = value
+
+    for option in cmake_options:
+        if not option.startswith("-D"):
+            continue
+        name, value = option[2:].split("=", 1)
+        if cached_variables.get(name) != value:
+            return False
+
+    return True
 
 
 class bdist_egg_disabled(bdist_egg):
@@ -163,24 +257,37 @@ class sdist_git_version(sdist):
         os.unlink("git_extra_version")
 
 
+@functools.lru_cache(maxsize=1)
 def git_extra_version():
     """
     If git is available, it is used to check if we are installing a development
     version or a released version (by checking how many commits happened since
     the last tag).
+
+    The result is cached since setup.py can be re-invoked multiple times per
+    build (egg_info, sdist, build, install), and git does not change in between.
     """
+    # allow skipping the git queries entirely, e.g. in CI where the version is
+    # already known to be a released one
+    if os.environ.get("RASCALINE_SKIP_GIT_VERSION", "") != "":
+        return ""
 
     # Add pre-release info the version
     try:
-        tags_list = subprocess.run(
-            ["git", "tag"],
+        # a single `git describe` gives us both the last tag and the number of
+        # commits since this tag, as `<tag>-<n_commits_since_tag>-g<hash>`
+        description = subprocess.run(
+            ["git", "describe", "--tags", "--long"],
             stderr=subprocess.DEVNULL,
             stdout=subprocess.PIPE,
             check=True,
         )
-        tags_list = tags_list.stdout.decode("utf8").strip()
-
-        if tags_list == "":
+        description = description.stdout.decode("utf8").strip()
+        n_commits_since_tag = description.rsplit("-", 2)[1]
+    except Exception:
+        # this happens if git is not available, or if there is no tag in the
+        # repository; in the latter case count the commits since the first one
+        try:
             first_commit = subprocess.run(
                 ["git", "rev-list", "--max-parents=0", "HEAD"],
                 stderr=subprocess.DEVNULL,
@@ -189,33 +296,18 @@ def git_extra_version():
             )
             reference = first_commit.stdout.decode("utf8").strip()
 
-        else:
-            last_tag = subprocess.run(
-                ["git", "describe", "--tags", "--abbrev=0"],
+            n_commits_since_tag = subprocess.run(
+                ["git", "rev-list", f"{reference}..HEAD", "--count"],
                 stderr=subprocess.DEVNULL,
                 stdout=subprocess.PIPE,
                 check=True,
             )
+            n_commits_since_tag = n_commits_since_tag.stdout.decode("utf8").strip()
+        except Exception:
+            return ""
 
-            reference = last_tag.stdout.decode("utf8").strip()
-
-    except Exception:
-        reference = ""
-        pass
-
-    try:
-        n_commits_since_tag = subprocess.run(
-            ["git", "rev-list", f"{reference}..HEAD", "--count"],
-            stderr=subprocess.DEVNULL,
-            stdout=subprocess.PIPE,
-            check=True,
-        )
-        n_commits_since_tag = n_commits_since_tag.stdout.decode("utf8").strip()
-
-        if n_commits_since_tag != 0:
-            return ".dev" + n_commits_since_tag
-    except Exception:
-        pass
+    if n_commits_since_tag != "0":
+        return ".dev" + n_commits_since_tag
 
     return ""
 
@@ -247,12 +339,14 @@ if __name__ == "__main__":
     ]
     if os.path.exists(RASCALINE_C_API):
         # we are building from a git checkout
+        import uuid
+
         rascaline_path = os.path.realpath(os.path.join(ROOT, "..", ".."))
 
         # add a random uuid to the file url to prevent pip from using a cached
         # wheel for rascaline, and force it to re-build from scratch
-        uuid = uuid.uuid4()
-        install_requires.append(f"rascaline @ file://{rascaline_path}?{uuid}")
+        cache_buster = uuid.uuid4()
+        install_requires.append(f"rascaline @ file://{rascaline_path}?{cache_buster}")
     else:
         # we are building from a sdist/installing from a wheel
         install_requires.append("rascaline >=0.1.0.dev0,<0.2.0")
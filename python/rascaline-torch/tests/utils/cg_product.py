@@ -69,12 +69,15 @@ def test_torch_script_tensor_compute(selected_keys: Labels, keys_filter):
         o3_lambda_2_new_name="l_2",
         selected_keys=selected_keys,
     )
+    # the scripted path also disables the input checks, to cover the
+    # `check_inputs` flag under TorchScript
     scripted_nu_2 = scripted_calculator.compute(
         mts.rename_dimension(nu_1, "properties", "n", "n_1"),
         mts.rename_dimension(nu_1, "properties", "n", "n_2"),
         o3_lambda_1_new_name="l_1",
         o3_lambda_2_new_name="l_2",
         selected_keys=selected_keys,
+        check_inputs=False,
     )
     mts.equal_metadata_raise(scripted_nu_2, ref_nu_2)
     assert mts.allclose(scripted_nu_2, ref_nu_2)
@@ -60,7 +60,11 @@ class ClebschGordanProduct(TorchModule):
         :param arrays_backend: :py:class:`str`, the backend to use for array operations.
             If ``None``, the backend is automatically selected based on the environment.
             Possible values are "numpy" and "torch".
-        :param dtype: the scalar type to use to store coefficients
+        :param dtype: the scalar type to use to store coefficients. This must match the
+            dtype of the tensors passed to :py:meth:`compute`. Lower precisions (i.e.
+            ``float32``) halve the memory traffic on the coefficient table during the
+            tensor products; CG coefficients are bounded rational-derived values, so
+            they are well represented at lower precision.
         :param device: the computational device to use for calculations. This must be
             ``"cpu"`` if ``array_backend="numpy"``.
         """
@@ -144,6 +148,7 @@ class ClebschGordanProduct(TorchModule):
         o3_lambda_1_new_name: str,
         o3_lambda_2_new_name: str,
         selected_keys: Optional[Labels] = None,
+        check_inputs: bool = True,
     ) -> TensorMap:
         """
         Computes the Clebsch-Gordan (CG) tensor product between ``tensor_1`` and
@@ -198,6 +203,11 @@ class ClebschGordanProduct(TorchModule):
         :param selected_keys: :py:class:`Labels`, the keys to compute on the final
             iteration. If ``None``, all keys are computed. Subsets of key dimensions can
             be passed to compute output blocks that match in these dimensions.
+        :param check_inputs: :py:class:`bool`, whether to validate the metadata of the
+            input tensors. This is enabled by default, but can be disabled to skip the
+            validation overhead, i.e. when calling :py:meth:`compute` repeatedly inside
+            a training loop. When disabled, it is the caller's responsibility to ensure
+            the inputs are valid.
 
         :return: A :py:class:`TensorMap` containing the Clebsch-Gordan tensor product of
             ``tensor_1`` and ``tensor_2``.
@@ -210,6 +220,7 @@ class ClebschGordanProduct(TorchModule):
             o3_lambda_2_new_name=o3_lambda_2_new_name,
             selected_keys=selected_keys,
             compute_metadata=False,
+            check_inputs=check_inputs,
         )
 
     def forward(
@@ -219,6 +230,7 @@ class ClebschGordanProduct(TorchModule):
         o3_lambda_1_new_name: str,
         o3_lambda_2_new_name: str,
         selected_keys: Optional[Labels] = None,
+        check_inputs: bool = True,
     ) -> TensorMap:
         """
         Calls the :py:meth:`ClebschGordanProduct.compute` function.
@@ -234,6 +246,7 @@ class ClebschGordanProduct(TorchModule):
             o3_lambda_1_new_name=o3_lambda_1_new_name,
             o3_lambda_2_new_name=o3_lambda_2_new_name,
             selected_keys=selected_keys,
+            check_inputs=check_inputs,
         )
 
     def compute_metadata(
@@ -268,6 +281,7 @@ class ClebschGordanProduct(TorchModule):
         o3_lambda_2_new_name: str,
         selected_keys: Optional[Labels],
         compute_metadata: bool,
+        check_inputs: bool = True,
     ) -> TensorMap:
         """
         Computes the Clebsch-Gordan tensor product between ``tensor_1`` and
@@ -291,7 +305,8 @@ class ClebschGordanProduct(TorchModule):
             5. Returns the resulting tensor in :py:class:`TensorMap` format.
         """
         # 1. Check the inputs
-        self._check_inputs(tensor_1, tensor_2, selected_keys)
+        if check_inputs:
+            self._check_inputs(tensor_1, tensor_2, selected_keys)
 
         # 2. Compute the full product of the two keys
         output_keys, combinations = _utils._compute_output_keys(
@@ -318,13 +333,18 @@ class ClebschGordanProduct(TorchModule):
             output_keys, combinations
         )
 
-        # 4. Do the CG tensor product for each block combination
+        # 4. Do the CG tensor product for each block combination. The blocks of
+        # both tensors are extracted to flat lists once, so the loop below
+        # indexes a Python list instead of doing a TensorMap block lookup per
+        # combination.
+        blocks_1 = tensor_1.blocks()
+        blocks_2 = tensor_2.blocks()
         output_blocks: List[TensorBlock] = []
         for combination in combinations:
             output_blocks.extend(
                 _utils.cg_tensor_product_blocks(
-                    tensor_1.block(combination.first),
-                    tensor_2.block(combination.second),
+                    blocks_1[combination.first],
+                    blocks_2[combination.second],
                     o3_lambdas=combination.o3_lambdas,
                     cg_coefficients=self._cg_coefficients,
                     cg_backend="metadata" if compute_metadata else self._cg_backend,
@@ -379,18 +399,20 @@ class ClebschGordanProduct(TorchModule):
             # Update `max_angular` if angular selection is being performed via
             # `selected_keys`
             if "o3_lambda" in selected_keys.names:
-                # Check max of 'o3_lambda' column is valid
-                for lam in selected_keys.column("o3_lambda"):
-                    if lam > self._max_angular:
-                        raise ValueError(
-                            "the maximum angular momentum value found in key dimension"
-                            " `'o3_lambda'` in `selected_keys` exceeds"
-                            f" `max_angular={self._max_angular}`"
-                            " used to calculate the CG coefficients in the constructor."
-                        )
-                max_angular = min(
-                    max_angular, int(_dispatch.max(selected_keys.column("o3_lambda")))
+                # Check max of 'o3_lambda' column is valid. The column is only
+                # materialized and reduced once, instead of scanning it element
+                # by element.
+                selected_max_angular = int(
+                    _dispatch.max(selected_keys.column("o3_lambda"))
                 )
+                if selected_max_angular > self._max_angular:
+                    raise ValueError(
+                        "the maximum angular momentum value found in key dimension"
+                        " `'o3_lambda'` in `selected_keys` exceeds"
+                        f" `max_angular={self._max_angular}`"
+                        " used to calculate the CG coefficients in the constructor."
+                    )
+                max_angular = min(max_angular, selected_max_angular)
             if "o3_sigma" in selected_keys.names:
                 # Check 'o3_sigma' column is valid
                 for o3_sigma in selected_keys.column("o3_sigma"):
@@ -417,14 +439,14 @@ class ClebschGordanProduct(TorchModule):
                     " `metatensor.rename_dimension` and try again."
                 )
 
-        # Check no gradients as not currently supported.
-        contains_gradients_1 = all(
-            [len(list(block.gradients())) > 0 for _, block in tensor_1.items()]
-        )
-        contains_gradients_2 = all(
-            [len(list(block.gradients())) > 0 for _, block in tensor_2.items()]
-        )
-        if contains_gradients_1 or contains_gradients_2:
+        # Check no gradients as not currently supported. All blocks of a valid
+        # TensorMap have the same gradients, so checking the first block of each
+        # tensor is enough, instead of scanning every block.
+        contains_gradients = False
+        for tensor in [tensor_1, tensor_2]:
+            if len(tensor) > 0 and len(tensor.block(0).gradients_list()) > 0:
+                contains_gradients = True
+        if contains_gradients:
             raise NotImplementedError(
                 "Clebsch Gordan combinations with gradients not yet implemented."
                 " Use `metatensor.remove_gradients` to remove gradients from the input"
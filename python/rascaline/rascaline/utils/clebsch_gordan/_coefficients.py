@@ -31,6 +31,11 @@ UNKNOWN_ARRAY_TYPE = (
     "unknown array type, only numpy arrays and torch tensors are supported"
 )
 
+# cache of dense CG coefficient dicts computed by `calculate_cg_coefficients`,
+# keyed by (lambda_max, arrays_backend, dtype, device). The coefficient tables
+# are small and only ever read, so they are safely shared between calculators.
+_CG_COEFF_DICT_CACHE = {}
+
 
 def calculate_cg_coefficients(
     lambda_max: int,
@@ -106,15 +111,20 @@ def calculate_cg_coefficients(
 
     # Calculate the CG coefficients, stored as a dict of dense arrays. This is the
     # starting point for the conversion to a TensorMap of different formats depending on
-    # the backend options.
-    cg_coeff_dict = _build_dense_cg_coeff_dict(
-        lambda_max,
-        complex_like,
-        labels_values_like,
-        arrays_backend=arrays_backend,
-        dtype=dtype,
-        device=device,
-    )
+    # the backend options. The raw coefficients do not depend on the CG backend, so
+    # they are cached at module scope: calculators built with the same settings but
+    # different backends (e.g. sparse and dense) share a single computation.
+    cache_key = (lambda_max, arrays_backend, str(dtype), str(device))
+    if cache_key not in _CG_COEFF_DICT_CACHE:
+        _CG_COEFF_DICT_CACHE[cache_key] = _build_dense_cg_coeff_dict(
+            lambda_max,
+            complex_like,
+            labels_values_like,
+            arrays_backend=arrays_backend,
+            dtype=dtype,
+            device=device,
+        )
+    cg_coeff_dict = _CG_COEFF_DICT_CACHE[cache_key]
 
     # Build the CG cache depending on whether the CG backend is sparse or dense. The
     # dispatching of the arrays backends are accounted for by `real_like` and
@@ -446,9 +456,11 @@ def cg_couple(
         array = array.swapaxes(1, 3)
         array = array.reshape(n_samples * n_properties, 2 * l2 + 1, 2 * l1 + 1)
 
-        for o3_lambda in o3_lambdas:
-            result = _cg_couple_dense(array, o3_lambda, cg_coefficients)
-            result = result.reshape(n_samples, n_properties, -1)
+        # couple to all requested lambdas with a single matrix product
+        outputs = _cg_couple_dense_batched(array, o3_lambdas, cg_coefficients)
+
+        for output in outputs:
+            result = output.reshape(n_samples, n_properties, -1)
             result = result.swapaxes(1, 2)
             results.append(result)
 
@@ -490,32 +502,38 @@ def _cg_couple_sparse(
         array, (2 * o3_lambda + 1, array.shape[0], array.shape[1])
     )
 
-    # Fill in each mu component of the output array in turn
+    # Fill in each mu component of the output array in turn. The (m1, m2, mu)
+    # indices are read from the samples values in one go, which is much cheaper
+    # than extracting one Labels entry per coefficient.
     cg_l1l2lam = cg_coefficients.block({"l1": l1, "l2": l2, "lambda": o3_lambda})
-    cg_l1l2lam_samples = cg_l1l2lam.samples
-    for i in range(len(cg_l1l2lam_samples)):
-        m1m2mu = cg_l1l2lam_samples.entry(i)
-        m1 = int(m1m2mu[0])
-        m2 = int(m1m2mu[1])
-        mu = int(m1m2mu[2])
+    m1m2mu = cg_l1l2lam.samples.values
+    cg_values = cg_l1l2lam.values
+    for i in range(m1m2mu.shape[0]):
+        m1 = int(m1m2mu[i, 0])
+        m2 = int(m1m2mu[i, 1])
+        mu = int(m1m2mu[i, 2])
         # Broadcast arrays, multiply together and with CG coeff
-        output[mu, :, :] += arrays[str((m1, m2))] * cg_l1l2lam.values[i, 0]
+        output[mu, :, :] += arrays[str((m1, m2))] * cg_values[i, 0]
 
     return output.swapaxes(0, 1)
 
 
-def _cg_couple_dense(
+def _cg_couple_dense_batched(
     array: Array,
-    o3_lambda: int,
+    o3_lambdas: List[int],
     cg_coefficients: TensorMap,
-) -> Array:
+) -> List[Array]:
     """
-    Couple two spherical harmonics (of degree ``l1`` and ``l2``) to a single one (of
-    degree ``o3_lambda``) using CG coefficients. This is a "dense" implementation, using
-    all CG coefficients at the same time.
+    Couple two spherical harmonics (of degree ``l1`` and ``l2``) to all of the
+    requested ``o3_lambdas`` at once, using CG coefficients.
+
+    The CG coefficient matrices for the different ``o3_lambdas`` are stacked along
+    their output (``mu``) axis, so a single matrix product computes all of the
+    couplings instead of dispatching one small matrix product per ``o3_lambda``.
+    The result is then split back into one array per ``o3_lambda``.
 
     :param array: input array, we expect a shape of ``[samples, 2*l1 + 1, 2*l2 + 1]``
-    :param o3_lambda: value of lambda for the output spherical harmonic
+    :param o3_lambdas: list of lambda values for the output spherical harmonics
     :param cg_coefficients: CG coefficients as returned by
         :py:func:`calculate_cg_coefficients` with ``cg_backed="python-dense"``
     """
@@ -524,16 +542,29 @@ def _cg_couple_dense(
     l1 = (array.shape[1] - 1) // 2
     l2 = (array.shape[2] - 1) // 2
 
-    cg_l1l2lam = cg_coefficients.block({"l1": l1, "l2": l2, "lambda": o3_lambda}).values
+    # [l1, l2, lambda] -> [(l1 l2), lambda], for each requested lambda
+    cg_blocks: List[Array] = []
+    for o3_lambda in o3_lambdas:
+        cg_l1l2lam = cg_coefficients.block(
+            {"l1": l1, "l2": l2, "lambda": o3_lambda}
+        ).values
+        cg_blocks.append(cg_l1l2lam.reshape(-1, 2 * o3_lambda + 1))
 
     # [samples, l1, l2] => [samples, (l1 l2)]
     array = array.reshape(-1, (2 * l1 + 1) * (2 * l2 + 1))
 
-    # [l1, l2, lambda] -> [(l1 l2), lambda]
-    cg_l1l2lam = cg_l1l2lam.reshape(-1, 2 * o3_lambda + 1)
+    # [samples, (l1 l2)] @ [(l1 l2), sum of lambda] => [samples, sum of lambda]
+    combined = array @ _dispatch.concatenate(cg_blocks, axis=1)
 
-    # [samples, (l1 l2)] @ [(l1 l2), lambda] => [samples, lambda]
-    return array @ cg_l1l2lam
+    # split the combined output back into one [samples, lambda] array per lambda
+    results: List[Array] = []
+    start = 0
+    for o3_lambda in o3_lambdas:
+        stop = start + 2 * o3_lambda + 1
+        results.append(combined[:, start:stop])
+        start = stop
+
+    return results
 
 
 # ======================================================================= #
@@ -648,10 +679,10 @@ def _cg_tensor_product_sparse(
     partial_tensor_products = {}
     for o3_lambda in o3_lambdas:
         cg_l1l2lam = cg_coefficients.block({"l1": l1, "l2": l2, "lambda": o3_lambda})
-        for i in range(len(cg_l1l2lam.samples)):
-            m1m2mu = cg_l1l2lam.samples.entry(i)
-            m1 = int(m1m2mu[0])
-            m2 = int(m1m2mu[1])
+        m1m2mu = cg_l1l2lam.samples.values
+        for i in range(m1m2mu.shape[0]):
+            m1 = int(m1m2mu[i, 0])
+            m2 = int(m1m2mu[i, 1])
 
             # We use a string as dict key since TorchScript does not support (int, int)
             dict_key = str((m1, m2))
@@ -696,10 +727,12 @@ def _cg_tensor_product_dense(
     # [samples, l2, p, l1, q] -> [(samples q p), l1, l2]
     tensor_product = tensor_product.reshape(-1, 2 * l1 + 1, 2 * l2 + 1)
 
+    # couple to all requested lambdas with a single matrix product
+    outputs = _cg_couple_dense_batched(tensor_product, o3_lambdas, cg_coefficients)
+
     result = []
-    for o3_lambda in o3_lambdas:
+    for output in outputs:
         # output shape is [(samples q p), lambda]
-        output = _cg_couple_dense(tensor_product, o3_lambda, cg_coefficients)
         #  => [samples, (q p), lambda]
         output = output.reshape(n_s, (n_p * n_q), -1)
         #  => [samples, lambda, (q p)]
@@ -57,6 +57,21 @@ class DensityCorrelations(TorchModule):
         super().__init__()
 
         self._n_correlations = n_correlations
+
+        # The new key dimension names used to track intermediate correlations
+        # only depend on the iteration number, so they are built once here
+        # instead of on every compute() call. The conditional clause is a
+        # matter of convention: "l" indices track blocks of nu=1 densities, and
+        # "k" indices track blocks originating from higher order tensors.
+        self._o3_lambda_1_new_names: List[str] = []
+        self._o3_lambda_2_new_names: List[str] = []
+        for i_correlation in range(n_correlations):
+            if i_correlation == 0:
+                self._o3_lambda_1_new_names.append(f"l_{i_correlation + 1}")
+            else:
+                self._o3_lambda_1_new_names.append(f"k_{i_correlation + 1}")
+            self._o3_lambda_2_new_names.append(f"l_{i_correlation + 2}")
+
         self._cg_product = ClebschGordanProduct(
             max_angular=max_angular,
             cg_backend=cg_backend,
@@ -169,40 +184,38 @@ class DensityCorrelations(TorchModule):
         # Prepare the tensors. Before the first iteration, both the 'left' and 'right'
         # densities should have a "_1" suffix in the property names. The property names
         # of the 'right' density is incremented by one at the start of each iteration.
-        density_correlations = _increment_property_names(density, 1)
+        # Renaming is done once and the result shared: the loop below re-assigns
+        # `density` to a freshly renamed tensor before the two are combined.
         density = _increment_property_names(density, 1)
+        density_correlations = density
+
+        # The angular cutoff selection is the same for every iteration it
+        # applies to, so the corresponding Labels is only built once.
+        angular_selection: Optional[Labels] = None
+        if angular_cutoff is not None:
+            angular_selection = Labels(
+                names=["o3_lambda"],
+                values=_dispatch.int_range_like(
+                    0, angular_cutoff + 1, like=density.keys.values
+                ).reshape(-1, 1),
+            )
 
         # Perform iterative CG tensor products
-        new_lambda_names: List[str] = []
         for i_correlation in range(self._n_correlations):
             # Increment the density property dimension names
             density = _increment_property_names(density, 1)
 
-            # Define new key dimension names for tracking intermediate correlations. The
-            # following conditional clause is a matter of convention. "l" indices track
-            # blocks of nu=1 densities, and "k" indices track blocks originating from
-            # higher order tensors.
-            if i_correlation == 0:
-                o3_lambda_1_new_name: str = f"l_{i_correlation + 1}"
-            else:
-                o3_lambda_1_new_name: str = f"k_{i_correlation + 1}"
-            o3_lambda_2_new_name: str = f"l_{i_correlation + 2}"
-            new_lambda_names.extend([o3_lambda_1_new_name, o3_lambda_2_new_name])
+            # New key dimension names for tracking intermediate correlations,
+            # precomputed in the constructor
+            o3_lambda_1_new_name = self._o3_lambda_1_new_names[i_correlation]
+            o3_lambda_2_new_name = self._o3_lambda_2_new_names[i_correlation]
 
             # Define the selected keys for the current iteration, applying the
             # ``angular_cutoff`` if specified.
             if (
                 i_correlation == self._n_correlations - 1 and selected_keys is None
             ) or (i_correlation < self._n_correlations - 1):
-                if angular_cutoff is None:
-                    selected_keys_iteration = None
-                else:
-                    selected_keys_iteration: Labels = Labels(
-                        names=["o3_lambda"],
-                        values=_dispatch.int_range_like(
-                            0, angular_cutoff + 1, like=density.keys.values
-                        ).reshape(-1, 1),
-                    )
+                selected_keys_iteration = angular_selection
             else:
                 assert i_correlation == self._n_correlations - 1
                 assert selected_keys is not None
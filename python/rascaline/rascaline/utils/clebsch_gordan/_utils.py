@@ -4,7 +4,7 @@ Private module containing helper functions for public module
 :py:class:`TensorMap`.
 """
 
-from typing import List, Tuple
+from typing import Dict, List, Tuple
 
 from .. import _dispatch
 from .._backend import Labels, TensorBlock, TensorMap
@@ -172,20 +172,20 @@ def _group_combinations_of_same_blocks(
     same order as the output keys.
     """
     # (block_1, block_2) => list of index in the output keys
-    # this is emulating a dict by separating keys & values since TorchScript does not
-    # support Tuple[int, int] as Dict keys. `groups` is the dict keys and `groups_keys`
-    # the dict values.
+    # `groups` holds the (block_1, block_2) pairs and `groups_keys` the list of
+    # key indices for each pair. `group_ids` maps a pair to its position in
+    # these two lists; TorchScript does not support Tuple[int, int] as Dict
+    # keys, so the pair is serialized to a string.
     groups: List[Tuple[int, int]] = []
     groups_keys: List[List[int]] = []
+    group_ids: Dict[str, int] = {}
     for key_i, blocks in enumerate(combinations):
-        group_id = -1
-        for existing_id, existing in enumerate(groups):
-            if existing == blocks:
-                group_id = existing_id
-                break
-
-        if group_id == -1:
+        blocks_id = str(blocks[0]) + "_" + str(blocks[1])
+        if blocks_id in group_ids:
+            group_id = group_ids[blocks_id]
+        else:
             group_id = len(groups)
+            group_ids[blocks_id] = group_id
             groups.append(blocks)
             keys_idx: List[int] = []
             groups_keys.append(keys_idx)
@@ -29,12 +29,6 @@ try:
     HAS_METATENSOR_OPERATIONS = True
 except ImportError:
     HAS_METATENSOR_OPERATIONS = False
-try:
-    import sympy  # noqa: F401
-
-    HAS_SYMPY = True
-except ImportError:
-    HAS_SYMPY = False
 
 
 if HAS_TORCH:
@@ -105,6 +99,35 @@ def test_keys_are_matched():
         assert name in lambda_soap.keys.names
 
 
+def test_check_inputs_disabled():
+    """
+    Tests that passing ``check_inputs=False`` to :py:meth:`compute` gives the same
+    output as the default path with the input checks enabled.
+    """
+    frames = h2o_isolated()
+    calculator = ClebschGordanProduct(max_angular=MAX_ANGULAR * 2)
+
+    density = spherical_expansion(frames)
+    density_1 = metatensor.rename_dimension(density, "properties", "n", "n_1")
+    density_2 = metatensor.rename_dimension(density, "properties", "n", "n_2")
+
+    checked = calculator.compute(
+        density_1,
+        density_2,
+        o3_lambda_1_new_name="l_1",
+        o3_lambda_2_new_name="l_2",
+    )
+    unchecked = calculator.compute(
+        density_1,
+        density_2,
+        o3_lambda_1_new_name="l_1",
+        o3_lambda_2_new_name="l_2",
+        check_inputs=False,
+    )
+
+    assert metatensor.equal(checked, unchecked)
+
+
 def test_key_matching_versus_manual_property_matching():
     """
     Tests that the output tensor from these processes are equivalent:
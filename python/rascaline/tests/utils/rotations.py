@@ -12,6 +12,7 @@ ase = pytest.importorskip("ase")
 
 import numpy as np  # noqa: E402
 from metatensor import TensorBlock, TensorMap  # noqa: E402
+from scipy.linalg import expm  # noqa: E402
 from scipy.spatial.transform import Rotation  # noqa: E402
 
 
@@ -38,23 +39,6 @@ def cartesian_rotation(angles: Sequence[float]):
     return Rotation.from_euler("ZYZ", angles).as_matrix()
 
 
-def transform_frame_so3(frame: ase.Atoms, angles: Sequence[float]) -> ase.Atoms:
-    """
-    Transforms the positions and cell coordinates of an ASE frame by a SO(3)
-    rigid rotation.
-    """
-    new_frame = frame.copy()
-
-    # Build cartesian rotation matrix
-    R = cartesian_rotation(angles)
-
-    # Rotate its positions and cell
-    new_frame.positions = new_frame.positions @ R.T
-    new_frame.cell = new_frame.cell @ R.T
-
-    return new_frame
-
-
 def transform_frame_o3(frame: ase.Atoms, angles: Sequence[float]) -> ase.Atoms:
     """
     Transforms the positions and cell coordinates of an ASE frame by an O(3)
@@ -295,18 +279,28 @@ def _wigner_d(angular_l: int, angles: Sequence[float]) -> np.ndarray:
     """
     Computes the Wigner D matrix:
         D^l_{mm'}(alpha, beta, gamma)
-    from sympy and converts it to numerical values.
+    numerically, in the complex spherical harmonics basis with m from -l to +l.
+
+    The beta rotation is the matrix exponential of the angular momentum
+    operator Jy, built from the usual ladder operators; the alpha and gamma
+    rotations around z are diagonal phases. This reproduces the values (and
+    conventions) of sympy's ``wigner_d`` without the cost of symbolic
+    evaluation.
 
     `angles` are the alpha, beta, gamma Euler angles (radians, ZYZ convention)
     and l the irrep.
     """
-    try:
-        from sympy.physics.wigner import wigner_d
-    except ModuleNotFoundError:
-        raise ModuleNotFoundError(
-            "Calculation of Wigner D matrices requires a sympy installation"
-        )
-    return np.complex128(wigner_d(angular_l, *angles))
+    alpha, beta, gamma = angles
+    m = np.arange(-angular_l, angular_l + 1)
+
+    # (J+)_{m+1, m} = sqrt(l (l + 1) - m (m + 1)), and J- is its transpose
+    ladder = np.sqrt(angular_l * (angular_l + 1) - m[:-1] * (m[:-1] + 1))
+    j_plus = np.diag(ladder, k=-1)
+    j_minus = np.diag(ladder, k=1)
+    j_y = (j_plus - j_minus) / 2j
+
+    small_d = expm(-1j * beta * j_y)
+    return np.exp(-1j * m[:, None] * alpha) * small_d * np.exp(-1j * m[None, :] * gamma)
 
 
 def _r2c(sp):
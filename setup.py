@@ -1,9 +1,9 @@
+import functools
 import glob
 import os
 import shutil
 import subprocess
 import sys
-import uuid
 
 from setuptools import Extension, setup
 from setuptools.command.bdist_egg import bdist_egg
@@ -50,10 +50,7 @@ class cmake_ext(build_ext):
         build_dir = os.path.join(ROOT, "build", "cmake-build")
         install_dir = os.path.join(os.path.realpath(self.build_lib), "rascaline")
 
-        try:
-            os.mkdir(build_dir)
-        except OSError:
-            pass
+        os.makedirs(build_dir, exist_ok=True)
 
         cmake_options = [
             f"-DCMAKE_INSTALL_PREFIX={install_dir}",
@@ -107,13 +104,37 @@ class cmake_ext(build_ext):
         else:
             raise ValueError(f"unknown platform: {sys.platform}")
 
+        # prefer the Ninja generator when available: it is faster than the
+        # default Makefiles/MSBuild generators, especially for no-op rebuilds
+        if shutil.which("ninja") is not None:
+            cmake_options.append("-GNinja")
+
+        remove_build_dir_on_generator_change(build_dir, cmake_options)
+
+        if not cmake_configure_is_cached(build_dir, cmake_options):
+            subprocess.run(
+                ["cmake", source_dir, *cmake_options],
+                cwd=build_dir,
+                check=True,
+            )
+
+        # `--parallel` without a value only parallelizes with some generators,
+        # so give an explicit job count, keeping CMAKE_BUILD_PARALLEL_LEVEL as
+        # an override
+        n_jobs = os.environ.get("CMAKE_BUILD_PARALLEL_LEVEL")
+        if n_jobs is None:
+            n_jobs = str(os.cpu_count() or 2)
+
         subprocess.run(
-            ["cmake", source_dir, *cmake_options],
-            cwd=build_dir,
-            check=True,
-        )
-        subprocess.run(
-            ["cmake", "--build", build_dir, "--parallel", "--target", "install"],
+            [
+                "cmake",
+                "--build",
+                build_dir,
+                "--parallel",
+                n_jobs,
+                "--target",
+                "install",
+            ],
             check=True,
         )
 
@@ -163,6 +184,60 @@ class sdist_git_version(sdist):
         os.unlink("git_extra_version")
 
 
+def remove_build_dir_on_generator_change(build_dir, cmake_options):
+    """
+    Remove ``build_dir`` if it was configured with a generator different from
+    the one requested in ``cmake_options``, since cmake refuses to change the
+    generator of an existing build directory.
+    """
+    generator = None
+    for option in cmake_options:
+        if option.startswith("-G"):
+            generator = option[2:]
+
+    cmake_cache = os.path.join(build_dir, "CMakeCache.txt")
+    if generator is None or not os.path.exists(cmake_cache):
+        return
+
+    with open(cmake_cache) as fd:
+        for line in fd:
+            if line.startswith("CMAKE_GENERATOR:"):
+                if line.split("=", 1)[1].strip() != generator:
+                    shutil.rmtree(build_dir)
+                    os.makedirs(build_dir)
+                return
+
+
+def cmake_configure_is_cached(build_dir, cmake_options):
+    """
+    Check whether ``build_dir`` was already configured by cmake with the same
+    ``cmake_options``, in which case the configure step can be skipped and
+    ``cmake --build`` invoked directly, re-using previous build artifacts.
+    """
+    cmake_cache = os.path.join(build_dir, "CMakeCache.txt")
+    if not os.path.exists(cmake_cache):
+        return False
+
+    cached_variables = {}
+    with open(cmake_cache) as fd:
+        for line in fd:
+            line = line.strip()
+            if line.startswith("//") or line.startswith("#") or "=" not in line:
+                continue
+            name, value = line.split("=", 1)
+            # remove the `:TYPE` suffix from the variable name
+            cached_variables[name.split(":")[0]] = value
+
+    for option in cmake_options:
+        if not option.startswith("-D"):
+            continue
+        name, value = option[2:].split("=", 1)
+        if cached_variables.get(name) != value:
+            return False
+
+    return True
+
+
 def get_rust_version():
     # read version from Cargo.toml
     with open(os.path.join(ROOT, "rascaline-c-api", "Cargo.toml")) as fd:
@@ -178,24 +253,37 @@ def get_rust_version():
     return version
 
 
+@functools.lru_cache(maxsize=1)
 def git_extra_version():
     """
     If git is available, it is used to check if we are installing a development
     version or a released version (by checking how many commits happened since
     the last tag).
+
+    The result is cached since setup.py can be re-invoked multiple times per
+    build (egg_info, sdist, build, install), and git does not change in between.
     """
+    # allow skipping the git queries entirely, e.g. in CI where the version is
+    # already known to be a released one
+    if os.environ.get("RASCALINE_SKIP_GIT_VERSION", "") != "":
+        return ""
 
     # Add pre-release info the version
     try:
-        tags_list = subprocess.run(
-            ["git", "tag"],
+        # a single `git describe` gives us both the last tag and the number of
+        # commits since this tag, as `<tag>-<n_commits_since_tag>-g<hash>`
+        description = subprocess.run(
+            ["git", "describe", "--tags", "--long"],
             stderr=subprocess.DEVNULL,
             stdout=subprocess.PIPE,
             check=True,
         )
-        tags_list = tags_list.stdout.decode("utf8").strip()
-
-        if tags_list == "":
+        description = description.stdout.decode("utf8").strip()
+        n_commits_since_tag = description.rsplit("-", 2)[1]
+    except Exception:
+        # this happens if git is not available, or if there is no tag in the
+        # repository; in the latter case count the commits since the first one
+        try:
             first_commit = subprocess.run(
                 ["git", "rev-list", "--max-parents=0", "HEAD"],
                 stderr=subprocess.DEVNULL,
@@ -204,33 +292,18 @@ def git_extra_version():
             )
             reference = first_commit.stdout.decode("utf8").strip()
 
-        else:
-            last_tag = subprocess.run(
-                ["git", "describe", "--tags", "--abbrev=0"],
+            n_commits_since_tag = subprocess.run(
+                ["git", "rev-list", f"{reference}..HEAD", "--count"],
                 stderr=subprocess.DEVNULL,
                 stdout=subprocess.PIPE,
                 check=True,
             )
+            n_commits_since_tag = n_commits_since_tag.stdout.decode("utf8").strip()
+        except Exception:
+            return ""
 
-            reference = last_tag.stdout.decode("utf8").strip()
-
-    except Exception:
-        reference = ""
-        pass
-
-    try:
-        n_commits_since_tag = subprocess.run(
-            ["git", "rev-list", f"{reference}..HEAD", "--count"],
-            stderr=subprocess.DEVNULL,
-            stdout=subprocess.PIPE,
-            check=True,
-        )
-        n_commits_since_tag = n_commits_since_tag.stdout.decode("utf8").strip()
-
-        if n_commits_since_tag != 0:
-            return ".dev" + n_commits_since_tag
-    except Exception:
-        pass
+    if n_commits_since_tag != "0":
+        return ".dev" + n_commits_since_tag
 
     return ""
 
@@ -252,11 +325,14 @@ if __name__ == "__main__":
     extras_require = {}
     if os.path.exists(RASCALINE_TORCH):
         # we are building from a git checkout
+        import uuid
 
         # add a random uuid to the file url to prevent pip from using a cached
         # wheel for rascaline-torch, and force it to re-build from scratch
-        uuid = uuid.uuid4()
-        extras_require["torch"] = f"rascaline-torch @ file://{RASCALINE_TORCH}?{uuid}"
+        cache_buster = uuid.uuid4()
+        extras_require["torch"] = (
+            f"rascaline-torch @ file://{RASCALINE_TORCH}?{cache_buster}"
+        )
     else:
         # we are building from a sdist/installing from a wheel
         extras_require["torch"] = "rascaline-torch >=0.1.0.dev0,<0.2.0"